@@ -1,6 +1,6 @@
 """Astronautica: A MUD in Space."""
 
-from asyncio import AbstractEventLoop, CancelledError, gather, get_event_loop, wait_for
+from asyncio import AbstractEventLoop, CancelledError, gather, wait_for
 from getopt import getopt
 from sys import argv, exit
 
@@ -31,10 +31,10 @@ except Exception as e:
 
 # from prompt_toolkit.eventloop import use_asyncio_event_loop
 
-from interface import get_client, setup_client, setup_host
+from interface import get_client, make_loop, setup_client, setup_host
 
 
-loop: AbstractEventLoop = get_event_loop()
+loop: AbstractEventLoop = make_loop()
 # loop.set_debug(True)
 # use_asyncio_event_loop(loop)
 
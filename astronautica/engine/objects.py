@@ -1,7 +1,6 @@
 """Module implementing the Base Class for all Objects which reside in Space."""
 from typing import Tuple, Set
 
-from astropy import units as u
 from attr import asdict, attrs
 from numba import jit
 import numpy as np
@@ -41,6 +40,10 @@ class Object(Node):
     def mass(self):
         return self.data.mass * self.data.units.mass
 
+    @property
+    def mass_kg(self) -> float:
+        return self.data.mass * self.data.units.mass_kg
+
     @property
     def radius(self):
         return self.data.radius
@@ -48,13 +51,13 @@ class Object(Node):
     @property
     def momentum(self):
         """p = mv"""
-        return self.mass.to_value(u.kg) * self.frame.velocity
+        return self.mass_kg * self.frame.velocity
 
     def impulse(self, impulse):
         """Momentum is Mass times Velocity, so the change in Velocity is the
             change in Momentum, or Impulse, divided by Mass.
         """
-        self.add_velocity(impulse / self.mass.to_value(u.kg))
+        self.add_velocity(impulse / self.mass_kg)
 
     def add_velocity(self, dv: np.ndarray):
         """Add an Array to the Velocity value of our Coordinates.
@@ -84,8 +87,8 @@ class Object(Node):
             normal,
             self.frame.velocity,
             other.frame.velocity,
-            self.mass.to_value(u.kg),
-            other.mass.to_value(u.kg),
+            self.mass_kg,
+            other.mass_kg,
         )
         # print("DeltaV:    ", t(), "sec")
 
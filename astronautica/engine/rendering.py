@@ -1,33 +1,64 @@
-from itertools import starmap
+"""Rendering Module: Plotting of Coordinates and Galaxies with Matplotlib.
 
-# from sys import exit
-from matplotlib.figure import Figure
-from typing import Tuple
+Matplotlib and Blessings are imported on first use, so that processes which
+    never render do not pay for them.
+"""
 
-from blessings import Terminal
-from matplotlib import use
+from functools import lru_cache
+from typing import List, Tuple, TYPE_CHECKING
 
-use("GTK3Cairo")
-
-from matplotlib import pyplot
-from mpl_toolkits.mplot3d import Axes3D
 import numpy as np
 from vectormath import Vector3
 
-from .space.geometry import from_spherical, to_spherical
+from .space.geometry import from_spherical, from_spherical_batch, to_spherical
+
+if TYPE_CHECKING:
+    from matplotlib.artist import Artist
+    from matplotlib.figure import Figure
+    from mpl_toolkits.mplot3d import Axes3D
+
+
+@lru_cache(maxsize=None)
+def _pyplot():
+    from matplotlib import use
+
+    use("GTK3Cairo")
+
+    from matplotlib import pyplot
+
+    return pyplot
+
+
+def _figure_agg(size: float) -> "Figure":
+    """Create a square Figure drawn by the Agg Canvas directly, bypassing the
+        PyPlot State Machine and the interactive Backend. Suitable for Figures
+        which are only ever saved to Files.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(size, size))
+    FigureCanvasAgg(fig)
+    return fig
 
 
-T = Terminal()
+@lru_cache(maxsize=None)
+def _terminal():
+    from blessings import Terminal
+
+    return Terminal()
 
 
 def axes(
-    fig: Figure,
+    fig: "Figure",
     min_: float = -1,
     max_: float = 1,
     *,
     azim: float = 245,
     elev: float = 30,
-) -> Axes3D:
+) -> "Axes3D":
+    from mpl_toolkits.mplot3d import Axes3D
+
     ax = Axes3D(fig, azim=azim, elev=elev)
 
     # ax.set_title("asdf")
@@ -46,7 +77,7 @@ point = lambda *points: ", ".join(map(str, np.round(points, 2)))
 
 
 def plot_spherical(
-    ax: Axes3D,
+    ax: "Axes3D",
     x: float,
     y: float,
     z: float,
@@ -57,8 +88,15 @@ def plot_spherical(
     cartesian_trace: bool = False,
     angle_square: bool = False,
     mark_final: bool = True,
-):
+) -> List["Artist"]:
+    """Plot a Point, with the Lines and Arcs which illustrate its Spherical
+        Coordinates, onto existing Axes.
+
+    Return all the Artists created, so that they can be removed later without
+        rebuilding the Axes.
+    """
     rho, theta, phi = to_spherical(x, y, z)
+    made: List["Artist"] = []
 
     color_rho = "red"
     color_theta = "green"
@@ -67,20 +105,25 @@ def plot_spherical(
     seg = 15
     w = 0.1
 
+    def text(*a, **kw):
+        made.append(ax.text(*a, **kw))
+
     def mark(x_, y_, z_, label: str = None):
-        ax.text(
+        text(
             x_, y_, z_, (label or "  {}").format(point(x_, y_, z_)),
         )
 
+    def plot_array(points: np.ndarray, **kw):
+        made.extend(ax.plot(points[..., 0], points[..., 1], points[..., 2], **kw))
+
     def plot(*points: Tuple[float, float, float], **kw):
-        points = np.array(points)
-        return ax.plot(points[..., 0], points[..., 1], points[..., 2], **kw)
+        plot_array(np.array(points), **kw)
 
-    arc_theta = lambda d=1: starmap(
-        from_spherical, ((rho * d, (theta / seg * i), phi) for i in range(seg + 1))
+    arc_theta = lambda d=1: from_spherical_batch(
+        rho * d, np.linspace(0, theta, seg + 1), phi
     )
-    arc_phi = lambda d=1: starmap(
-        from_spherical, ((rho * d, 0, (phi / seg * i)) for i in range(seg + 1))
+    arc_phi = lambda d=1: from_spherical_batch(
+        rho * d, 0, np.linspace(0, phi, seg + 1)
     )
 
     # Y-axis Line.
@@ -114,15 +157,15 @@ def plot_spherical(
 
     # SECONDARY Labels.
     if arcs_secondary:
-        ax.text(0, rho * 0.52, 0, "ρ", c="black")
-        ax.text(*from_spherical(rho * 0.52, (theta / 2), phi), "θ", c="black")
-        ax.text(*from_spherical(rho * 0.52, 0, (phi / 2)), "φ", c="black")
-        plot(*arc_theta(0.5), c=grey)  # GREY Theta Arc.
-        plot(*arc_phi(0.5), c=grey)  # GREY Phi Arc.
+        text(0, rho * 0.52, 0, "ρ", c="black")
+        text(*from_spherical(rho * 0.52, (theta / 2), phi), "θ", c="black")
+        text(*from_spherical(rho * 0.52, 0, (phi / 2)), "φ", c="black")
+        plot_array(arc_theta(0.5), c=grey)  # GREY Theta Arc.
+        plot_array(arc_phi(0.5), c=grey)  # GREY Phi Arc.
 
     if arcs_primary:
-        plot(*arc_theta(), c=color_theta)  # Theta Arc.
-        plot(*arc_phi(), c=color_phi)  # Phi Arc.
+        plot_array(arc_theta(), c=color_theta)  # Theta Arc.
+        plot_array(arc_phi(), c=color_phi)  # Phi Arc.
         plot((0, 0, 0), (x, y, z), c=color_rho)
         plot(
             (0, 0, 0),  # Origin.
@@ -132,7 +175,7 @@ def plot_spherical(
 
     # PRIMARY Labels.
     if label_primary:
-        ax.text(
+        text(
             x,
             y,
             z,
@@ -142,7 +185,7 @@ def plot_spherical(
             horizontalalignment="right",
             verticalalignment="bottom",
         )
-        ax.text(
+        text(
             *from_spherical(rho, (theta / 2), phi),
             f"θ ({np.round(theta, 2)}°)",
             c=color_theta,
@@ -150,7 +193,7 @@ def plot_spherical(
             horizontalalignment="left",
             verticalalignment="bottom",
         )
-        ax.text(
+        text(
             *from_spherical(rho, 0, (phi / 2)),
             f"φ ({np.round(phi, 2)}°)",
             c=color_phi,
@@ -162,6 +205,8 @@ def plot_spherical(
     if mark_final:
         mark(x, y, z, f"{{}}\n{point(rho, theta, phi)}")  # Endpoint.
 
+    return made
+
 
 def render_test_image(
     x: float = 0.8,
@@ -169,51 +214,109 @@ def render_test_image(
     z: float = 0.7,
     *,
     filename: str = "axes.png",
-    # spin: bool = False,
-    # scan: bool = False,
+    scan: bool = False,
+    frames: int = 360,
+    directory: str = "img/gif",
 ):
-    """Generate an image exemplifying the Coordinates System."""
-    fig: Figure = pyplot.figure(figsize=(8, 8))
-    ax: Axes3D = axes(fig, azim=245, elev=30)
+    """Generate an image exemplifying the Coordinates System.
 
-    plot_spherical(ax, x, y, z, arcs_primary=True, cartesian_trace=True)
+    If Scan is set, also generate a sequence of images sweeping a Point around
+        the System. The Figure and Axes are reused; Between frames, only the
+        Artists illustrating the Point are replaced.
+    """
+    fig: "Figure" = _pyplot().figure(figsize=(8, 8))
+    ax: "Axes3D" = axes(fig, azim=245, elev=30)
+
+    artists = plot_spherical(ax, x, y, z, arcs_primary=True, cartesian_trace=True)
 
     sc = np.array([getattr(ax, f"get_{d}lim")() for d in "xyz"])
     ax.auto_scale_xyz(*[[np.min(sc), np.max(sc)]] * 3)
 
     # ax.set_axis_off()
     fig.savefig(filename)
+
+    if scan:
+        T = _terminal()
+
+        # Position of the Point in every Frame, converted in one pass.
+        angles = np.arange(1, frames + 1)
+        points = from_spherical_batch(1, angles / 2 - 90, angles - 1).tolist()
+
+        try:
+            with T.hidden_cursor():
+                for angle, (x_, y_, z_) in zip(angles.tolist(), points):
+                    for artist in artists:
+                        artist.remove()
+
+                    artists = plot_spherical(
+                        ax, x_, y_, z_, arcs_primary=True, cartesian_trace=True
+                    )
+                    fig.savefig(f"{directory}/frame-{angle:0>3}.png")
+
+                    with T.location():
+                        print(
+                            f"Frame {angle:0>3}/{frames}  {angle/frames:>6.1%}  ",
+                            end="",
+                            flush=True,
+                        )
+        finally:
+            print()
+
     return ax, fig
 
-    # if spin or scan:
-    #     # ax.set_axis_off()
-    #     try:
-    #         with T.hidden_cursor():
-    #             final = 360
-    #             for angle in range(1, final + 1):
-    #                 if scan:
-    #                     ax, fig = plot_spherical(
-    #                         *from_spherical(1, angle / 2 - 90, angle - 1),
-    #                         filename=f"img/gif/frame-{angle:0>3}.png",
-    #                     )
-    #                     pyplot.close(fig)
-    #
-    #                 if spin:
-    #                     ax.view_init(30, angle - 1)
-    #                     fig.savefig(f"img/gif/frame-{angle:0>3}.png")
-    #
-    #                 with T.location():
-    #                     print(
-    #                         f"Frame {angle:0>3}/{final}  {angle/final:>6.1%}  ",
-    #                         end="",
-    #                         flush=True,
-    #                     )
-    #                 # pyplot.draw()
-    #                 # pyplot.pause(.1)
-    #     except KeyboardInterrupt:
-    #         exit(1)
-    #     finally:
-    #         print()
+
+def view_matrices(azim: np.ndarray, elev: float) -> np.ndarray:
+    """Build the Matrices which project three-dimensional Points onto the Screen
+        of an orthographic Camera, for a given Elevation and any number of
+        Azimuths, all in Degrees. The result is shaped (..., 2, 3).
+    """
+    az = np.radians(azim)
+    el = np.radians(elev)
+    sin_az, cos_az = np.sin(az), np.cos(az)
+
+    mats = np.zeros((*np.shape(az), 2, 3))
+    mats[..., 0, 0] = -sin_az
+    mats[..., 0, 1] = cos_az
+    mats[..., 1, 0] = -np.sin(el) * cos_az
+    mats[..., 1, 1] = -np.sin(el) * sin_az
+    mats[..., 1, 2] = np.cos(el)
+    return mats
+
+
+def render_galaxy_frames(
+    data: np.ndarray, scale: float = 1.5, size: float = 4, frames: int = 360
+):
+    """Generate a sequence of images orbiting a Galaxy.
+
+    Rather than have Axes3D project every Star for every Frame, the Projection
+        Matrices of all Frames are built at once, each Frame is projected with
+        one Matrix Product, and the Offsets of a single two-dimensional Scatter
+        are replaced between Frames.
+    """
+    T = _terminal()
+    fig = _figure_agg(size)
+
+    ax = fig.add_axes((0, 0, 1, 1))
+    ax.set_axis_off()
+    ax.set_aspect("equal")
+    ax.set_xlim(-scale, scale)
+    ax.set_ylim(-scale, scale)
+
+    data = np.ascontiguousarray(data[..., :3], dtype=float)
+    mats = view_matrices(np.arange(frames) * 360 / frames, 30)
+    stars = ax.scatter(*(data @ mats[0].T).T, c="#000000", s=1)
+
+    with T.hidden_cursor():
+        for frame, mat in enumerate(mats, 1):
+            stars.set_offsets(data @ mat.T)
+            fig.savefig(f"gif/frame-{frame:0>3}.png")
+            with T.location():
+                print(
+                    f"Frame {frame:0>3}/{frames}  {frame/frames:>6.1%}  ",
+                    end="",
+                    flush=True,
+                )
+    print()
 
 
 def render_galaxy(
@@ -228,31 +331,19 @@ def render_galaxy(
     make_frames: bool = False,
 ) -> None:
     print(f"Rendering {len(data)} stars...")
-    fig = pyplot.figure(figsize=(size, size))
 
-    ax = axes(fig, -scale, scale)
-    ax.scatter(
-        tuple(data[..., 0]), tuple(data[..., 1]), tuple(data[..., 2]), c="#000000", s=1
-    )
-
-    # pyplot.show()
     if filename:
+        fig = _figure_agg(size)
+
+        # One copy into three contiguous Columns, not three strided Views.
+        xs, ys, zs = np.ascontiguousarray(data[..., :3].T)
+
+        ax = axes(fig, -scale, scale)
+        # Rasterized, so that saving to a Vector Format embeds one Image of the
+        #   Stars, rather than a separate Path for each Star.
+        ax.scatter(xs, ys, zs, c="#000000", s=1, rasterized=True)
+
         fig.savefig(filename)  # , bbox_inches='tight')
 
     if make_frames:
-        ax.set_axis_off()
-        with T.hidden_cursor():
-            for angle in range(1, 361):
-                ax.view_init(30, angle - 1)
-                fig.savefig(f"gif/frame-{angle:0>3}.png")
-                with T.location():
-                    print(
-                        f"Frame {angle:0>3}/1080  {angle/1080:>6.1%}  ",
-                        end="",
-                        flush=True,
-                    )
-                # pyplot.draw()
-                # pyplot.pause(.1)
-        print()
-
-    pyplot.close(fig)
+        render_galaxy_frames(data, scale, size)
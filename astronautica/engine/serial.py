@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from inspect import isabstract
-from typing import Any, Dict, Iterator, List, NewType, Type, TypeVar, Union
+from typing import Any, Dict, List, NewType, Type, TypeVar, Union
 
 from astropy.units import Quantity
 
@@ -12,15 +12,21 @@ Serial: Type = NewType("Serial", Dict[str, "Primitive"])
 T = TypeVar("T")
 
 
-# Recursively check for Subclasses to map out all Types that should implement a
-#   .from_serial() Classmethod.
-def get_subs(t: type) -> Iterator[type]:
-    yield from map(get_subs, t.__subclasses__())
+# Every Subclass of Serializable, by Name. Filled as Classes are defined.
+MAP: Dict[str, Type["Serializable"]] = {}
 
 
 class Serializable(ABC):
     """ABC for Types that can be Serialized."""
 
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kw):
+        super().__init_subclass__(**kw)
+        # Abstract Methods are not yet known at this point, so Abstract Classes
+        #   are registered too, and filtered out by deserialize().
+        MAP[cls.__name__] = cls
+
     @abstractmethod
     def serialize(self) -> Serial:
         """Return a Dict representing this Object in a form that can be written
@@ -49,6 +55,8 @@ class Node(Serializable):
         of the interface required for the Spatial Hierarchy.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def mass(self) -> Quantity:
@@ -59,25 +67,22 @@ class Domain(Node):
     """A specialized Node which defines the core of a local Coordinates System.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def units(self) -> Units:
         ...
 
 
-MAP: Dict[str, Type[Serializable]] = {
-    t.__name__: t for t in get_subs(Serializable) if not isabstract(t)
-}
-
-
 def deserialize(obj: Union[List[Serial], Serial]):
     if isinstance(obj, list):
         return list(map(deserialize, obj))
 
-    classname: str = obj.get("class")
+    classname: str = obj.get("type")
     cls = MAP.get(classname)
 
-    if cls is not None:
+    if cls is not None and not isabstract(cls):
         data = obj.get("data")
         subs = {k: deserialize(v) for k, v in obj.get("subs", {}).items()}
         return cls.from_serial(data, subs)
@@ -16,17 +16,23 @@ Spherical Coordinates:
       Zenith: φ = 90°
 """
 
-from itertools import count
-from typing import Dict, Iterator, List, Optional, Sequence, Tuple
-from weakref import proxy
+from heapq import heapify, heappop, heappush
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from weakref import ref, WeakSet
 
 from astropy import constants as const
-from numba import jit
 import numpy as np
-from quaternion import as_float_array, from_float_array, quaternion
+from quaternion import from_float_array, quaternion
 from vectormath import Vector3
 
 from . import base, position, rotation
+from .geometry import (
+    apply_gravity,
+    apply_spin,
+    apply_velocity,
+    to_cylindrical_batch,
+    to_spherical_batch,
+)
 
 
 __all__ = ["base", "Coordinates", "LocalSpace", "position", "rotation", "Space"]
@@ -35,19 +41,41 @@ __all__ = ["base", "Coordinates", "LocalSpace", "position", "rotation", "Space"]
 INITIAL_DOMAINS = 5
 INITIAL_OBJECTS = 10
 
+# Gravitational Constant, in m³/(kg·s²), as a plain Float.
+G: float = const.G.to_value("m3 / (kg s2)")
+
+
+def claim(index: int, free: List[int], fresh: int) -> None:
+    """Take an Index out of a Heap of released Indices. Any Indices skipped
+        between the lowest never-used Index and the claimed one are added to
+        the Heap, so that they may be handed out later.
+    """
+    if free and free[0] == index:
+        heappop(free)
+    elif index < fresh:
+        if index in free:
+            free.remove(index)
+            heapify(free)
+    else:
+        for skipped in range(fresh, index):
+            heappush(free, skipped)
+
 
 class Space(object):
     """Coordinates tracker/handler object."""
 
     __slots__ = (
+        "_free_domains",
+        "_next_domain",
+        "_hdg_rot",
         "array_position",
         "array_velocity",
-        "array_heading",
-        "array_rotate",
         "domains",
+        "dtype",
+        "version",
     )
 
-    def __init__(self, struct: dict = None):
+    def __init__(self, struct: dict = None, dtype: np.dtype = np.float64):
         """Initialize positions and velocities to be ndarrays, three dimensions
             deep.
 
@@ -56,13 +84,32 @@ class Space(object):
         Second level is objects, this is the axis the index ID of each object
             refers to.
         Bottom level is the three values for X, Y, and Z.
+
+        Positions and Velocities are stored with the given DType. Single
+            Precision halves the memory moved on each step, for uses that can
+            afford to lose precision, such as visualization. Headings and
+            Rotations are always stored with Double Precision.
+
+        Headings and Rotations share one Array, eight Floats deep, so that the
+            two Quaternions of each Object sit side by side in memory.
         """
-        self.array_position = np.zeros((INITIAL_DOMAINS, INITIAL_OBJECTS, 3))
-        self.array_velocity = np.zeros((INITIAL_DOMAINS, INITIAL_OBJECTS, 3))
-        self.array_heading = np.zeros((INITIAL_DOMAINS, INITIAL_OBJECTS, 4))
-        self.array_rotate = np.zeros((INITIAL_DOMAINS, INITIAL_OBJECTS, 4))
+        self.dtype = np.dtype(dtype)
 
-        self.domains: Dict[int, List[int]] = {}
+        self.array_position = np.zeros(
+            (INITIAL_DOMAINS, INITIAL_OBJECTS, 3), self.dtype
+        )
+        self.array_velocity = np.zeros(
+            (INITIAL_DOMAINS, INITIAL_OBJECTS, 3), self.dtype
+        )
+        self._hdg_rot = np.zeros((INITIAL_DOMAINS, INITIAL_OBJECTS, 8))
+
+        self.domains: Dict[int, Set[int]] = {}
+        # Released Domain Indices, as a Heap, and the lowest never-used Index.
+        self._free_domains: List[int] = []
+        self._next_domain: int = 0
+
+        # Incremented whenever the Space Arrays are replaced by larger ones.
+        self.version: int = 0
 
         if struct is not None:
             struct["positions"] = self.array_position
@@ -73,50 +120,123 @@ class Space(object):
 
             struct["domains"] = self.domains
 
+    @property
+    def array_heading(self) -> np.ndarray:
+        return self._hdg_rot[..., :4]
+
+    @array_heading.setter
+    def array_heading(self, value: np.ndarray) -> None:
+        self._hdg_rot[..., :4] = value
+
+    @property
+    def array_rotate(self) -> np.ndarray:
+        return self._hdg_rot[..., 4:]
+
+    @array_rotate.setter
+    def array_rotate(self, value: np.ndarray) -> None:
+        self._hdg_rot[..., 4:] = value
+
     @property
     def next_domain_index(self) -> int:
-        return next(i for i in count() if i not in self.domains)
+        return self._free_domains[0] if self._free_domains else self._next_domain
 
     @property
-    def quat_heading(self) -> np.ndarray:
+    def quat_heading_obj(self) -> np.ndarray:
         return from_float_array(self.array_heading)
 
     @property
-    def quat_rotate(self) -> np.ndarray:
+    def quat_rotate_obj(self) -> np.ndarray:
         return from_float_array(self.array_rotate)
 
+    def positions_pol(self) -> np.ndarray:
+        """Return the Positions of every Object in every Domain in Spherical
+            Coordinates, converted in one pass over the Space Array.
+        """
+        return to_spherical_batch(self.array_position)
+
+    def velocities_pol(self) -> np.ndarray:
+        """Return the Velocities of every Object in every Domain in Spherical
+            Coordinates, converted in one pass over the Space Array.
+        """
+        return to_spherical_batch(self.array_velocity)
+
+    def serialize_rotations(self) -> Dict[str, list]:
+        """Return the Headings and Rotations of every Object in every Domain as
+            nested Lists, converted in one pass over each Space Array.
+        """
+        return {
+            "hdg": self.array_heading.tolist(),
+            "rot": self.array_rotate.tolist(),
+        }
+
+    def serialize_all(self) -> Dict[str, object]:
+        """Return the complete state of the Space as nested Lists, converted in
+            one pass over each Space Array, along with the Object Indices in use
+            in each Domain.
+        """
+        return {
+            "pos": self.array_position.tolist(),
+            "vel": self.array_velocity.tolist(),
+            **self.serialize_rotations(),
+            "domains": {d: sorted(used) for d, used in self.domains.items()},
+        }
+
+    def _ensure_capacity(self, domain: int, obj: int) -> None:
+        """Make sure the Space Arrays have room for a given Domain Index and a
+            given Object Index.
+
+        When either axis is too short, it is doubled until it fits, and all the
+            Arrays are replaced together, with existing values copied into the
+            new Arrays. Doubling keeps the cost of growth amortized constant per
+            added Domain or Object.
+        """
+        cap_d, cap_o = self.array_position.shape[:2]
+
+        if domain < cap_d and obj < cap_o:
+            return
+
+        new_d, new_o = cap_d, cap_o
+        while domain >= new_d:
+            new_d *= 2
+        while obj >= new_o:
+            new_o *= 2
+
+        for name in ("array_position", "array_velocity", "_hdg_rot"):
+            old = getattr(self, name)
+            new = np.zeros((new_d, new_o, old.shape[2]), old.dtype)
+            new[:cap_d, :cap_o] = old
+            setattr(self, name, new)
+
+        self.version += 1
+
     def add_domain(self, domain: "LocalSpace") -> int:
         """Add a new Domain. A Domain is essentially a set of Arrays within the
             Space Arrays which represent a locality in Space. Objects must be in
             the same Domain in order to interact.
         """
         next_domain: int = self.next_domain_index
+        claim(next_domain, self._free_domains, self._next_domain)
+        self._next_domain = max(self._next_domain, next_domain + 1)
 
-        # Place a Zero in the ID Dict to represent the new, empty, Domain.
+        # Place the (empty) Set of Indices of the new Domain in the ID Dict.
         self.domains[next_domain] = domain.used
 
-        shape = self.array_position.shape
-        while next_domain >= shape[0]:
-            # The Index of the new Domain is higher than the number of Arrays
-            #   available. Increase the size of the Array along the Domain axis.
-            #   To this end, initialize new Arrays of X Arrays of three Zeros,
-            #   where X is the number of Object Slots required in the new Domain
-            #   to maintain Shape.
-            self.array_position = np.append(
-                self.array_position, np.array([[[0, 0, 0]] * shape[1]]), 0
-            )
-            self.array_velocity = np.append(
-                self.array_velocity, np.array([[[0, 0, 0]] * shape[1]]), 0
-            )
-            self.array_heading = np.append(
-                self.array_heading, np.array([[[0, 0, 0, 0]] * shape[1]]), 0
-            )
-            self.array_rotate = np.append(
-                self.array_rotate, np.array([[[0, 0, 0, 0]] * shape[1]]), 0
-            )
+        self._ensure_capacity(next_domain, 0)
 
         return next_domain
 
+    def release_domain(self, index: int) -> None:
+        """Remove a Domain, and return its Index to be reused by a later Domain.
+            Its Rows of the Space Arrays are zeroed, as they would be if fresh,
+            so that nothing it held can leak into the next Domain there.
+        """
+        if index in self.domains:
+            del self.domains[index]
+            self.array_position[index] = 0
+            self.array_velocity[index] = 0
+            self._hdg_rot[index] = 0
+            heappush(self._free_domains, index)
+
     def add_frame_to_domain(
         self, domain: "LocalSpace", frame: "Coordinates", index: int = None
     ) -> int:
@@ -125,67 +245,64 @@ class Space(object):
         elif index in domain.used:
             raise IndexError(f"Index {index} is already allocated.")
 
-        domain.used.append(index)
-
-        shape = self.array_position.shape
-        while index >= shape[1]:
-            # Increase the size of the Array along the Object axis.
-            self.array_position = np.append(
-                self.array_position, np.array([[[0, 0, 0]]] * shape[0]), 1
-            )
-            self.array_velocity = np.append(
-                self.array_velocity, np.array([[[0, 0, 0]]] * shape[0]), 1
-            )
-            self.array_heading = np.append(
-                self.array_heading, np.array([[[0, 0, 0, 0]]] * shape[0]), 1
-            )
-            self.array_rotate = np.append(
-                self.array_rotate, np.array([[[0, 0, 0, 0]]] * shape[0]), 1
-            )
+        domain.claim_index(index)
+
+        self._ensure_capacity(0, index)
 
         frame.domain = domain
         return index
 
     def all_domains(self) -> Iterator["LocalSpace"]:
         for d in LocalSpace.ALL:
-            try:
-                if d.space is self:
-                    yield d
-            except:
-                continue
+            if d.space is self:
+                yield d
 
     @staticmethod
     def all_frames() -> Iterator["Coordinates"]:
         for f in Coordinates.ALL:
-            try:
-                if f.domain is not None:
-                    yield f
-            except:
-                continue
+            if f.domain is not None:
+                yield f
+
+    def translate(self, time: float):
+        """Advance the Positions of every Object in every Domain by their
+            Velocities over a span of Time, in one pass over the Space Arrays.
+        """
+        apply_velocity(self.array_position, self.array_velocity, time)
+
+    def spin(self, time: float):
+        """Advance the Headings of every Object in every Domain by their
+            Rotations over a span of Time, working directly on the Float Arrays.
+        """
+        apply_spin(self._hdg_rot, time)
 
-    @jit(forceobj=True, nopython=False)
     def progress(self, time: float):
-        self.array_position += self.array_velocity * time
-        self.array_heading = as_float_array(
-            from_float_array(self.array_rotate * np.array((time, 1, 1, 1)))
-            * self.quat_heading
-        )
+        """Advance every Object in the Space over a span of Time.
+
+        The compiled Kernels behind this reshape the Space Arrays without
+            copying, so the Arrays must stay C-contiguous. _ensure_capacity()
+            always allocates fresh contiguous Arrays, which guarantees this.
+        """
+        self.translate(time)
+        self.spin(time)
 
     def __getitem__(self, idx: int) -> "LocalSpace":
         return tuple(ls for ls in LocalSpace.ALL if ls.index == idx)[0]
 
 
 class LocalSpace(object):
-    ALL: List["LocalSpace"] = []
+    ALL: "WeakSet[LocalSpace]" = WeakSet()
 
     def __init__(self, master, space: Space):
         self.master = master
         self.space: Space = space
-        self.used: List[int] = []
+        self.used: Set[int] = set()
+        # Released Object Indices, as a Heap, and the lowest never-used Index.
+        self._free_indices: List[int] = []
+        self._next_fresh: int = 0
 
         self.index: int = self.space.add_domain(self)
 
-        self.ALL.append(proxy(self, self.free_wr))
+        self.ALL.add(self)
 
     @property
     def array_position(self) -> Sequence[Vector3]:
@@ -220,47 +337,122 @@ class LocalSpace(object):
         self.space.array_rotate[self.index] = value
 
     @property
-    def quat_heading(self) -> Sequence[quaternion]:
+    def heading_f(self) -> np.ndarray:
+        """The Headings of this Domain as raw Floats, shaped (O, 4). This is a
+            View into the Space Array, not a copy.
+        """
+        return self.space.array_heading[self.index]
+
+    @property
+    def rotate_f(self) -> np.ndarray:
+        """The Rotations of this Domain as raw Floats, shaped (O, 4). This is a
+            View into the Space Array, not a copy.
+        """
+        return self.space.array_rotate[self.index]
+
+    @property
+    def quat_heading_obj(self) -> Sequence[quaternion]:
         return from_float_array(self.array_heading)
 
     @property
-    def quat_rotate(self) -> Sequence[quaternion]:
+    def quat_rotate_obj(self) -> Sequence[quaternion]:
         return from_float_array(self.array_rotate)
 
     @property
     def next_object_index(self) -> int:
-        return next(i for i in count() if i not in self.used)
+        return self._free_indices[0] if self._free_indices else self._next_fresh
+
+    def claim_index(self, index: int) -> None:
+        """Mark an Object Index as used."""
+        claim(index, self._free_indices, self._next_fresh)
+        self._next_fresh = max(self._next_fresh, index + 1)
+        self.used.add(index)
+
+    def release_index(self, index: int) -> None:
+        """Return an Object Index to the pool, to be reused by the next Object
+            added to this Domain.
+        """
+        if index in self.used:
+            self.used.remove(index)
+            heappush(self._free_indices, index)
+
+    def positions_pol(self) -> np.ndarray:
+        """Return the Positions of every Object in this Domain in Spherical
+            Coordinates, shaped (O, 3). Renderers should prefer this to reading
+            each Coordinates separately.
+        """
+        return to_spherical_batch(self.array_position)
+
+    def velocities_pol(self) -> np.ndarray:
+        """Return the Velocities of every Object in this Domain in Spherical
+            Coordinates, shaped (O, 3).
+        """
+        return to_spherical_batch(self.array_velocity)
+
+    def positions_cyl(self) -> np.ndarray:
+        """Return the Positions of every Object in this Domain in Cylindrical
+            Coordinates, shaped (O, 3).
+        """
+        return to_cylindrical_batch(self.array_position)
+
+    def velocities_cyl(self) -> np.ndarray:
+        """Return the Velocities of every Object in this Domain in Cylindrical
+            Coordinates, shaped (O, 3).
+        """
+        return to_cylindrical_batch(self.array_velocity)
+
+    def as_seen_from(
+        self, pov: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return the Positions, Velocities, Headings and Rotations of every
+            Object in this Domain, from the perspective of the Object at a given
+            Index, in one pass over the Domain Arrays.
+
+        This is the batch form of Coordinates.as_seen_from().
+        """
+        undo = rotation.undo(self.heading_f[pov])
+
+        positions = rotation.apply(undo, self.array_position - self.array_position[pov])
+        velocities = rotation.apply(
+            undo, self.array_velocity - self.array_velocity[pov]
+        )
+        headings = rotation.multiply(self.heading_f, undo)
+
+        rotates = np.zeros_like(self.rotate_f)
+        rotates[:, 1:] = rotation.apply(undo, self.rotate_f[:, 1:])
+
+        return positions, velocities, headings, rotates
 
     def add_frame(self, frame: "Coordinates", index: int = None) -> int:
         return self.space.add_frame_to_domain(self, frame, index)
 
     def free(self):
-        if self.index in self.space.domain_indices:
-            del self.space.domain_indices[self.index]
-
+        self.space.release_domain(self.index)
         self.space = None
         self.used.clear()
 
-    def free_wr(self, prox):
-        if prox in self.ALL:
-            self.ALL.remove(prox)
-
-        self.free()
-
     def all_frames(self) -> Iterator["Coordinates"]:
         for f in Coordinates.ALL:
-            try:
-                if f.domain is self:
-                    yield f
-            except:
-                continue
-
-    @jit(nopython=True)
-    def gravitate(self, mass: float):
-        self.array_velocity -= np.array(
-            np.linalg.norm(vec) * ((const.G * mass) / np.square(vec.length))
-            for vec in self.array_position
-        )
+            if f.domain is self:
+                yield f
+
+    def translate(self, time: float):
+        """Advance the Positions of every Object in this Domain by their
+            Velocities over a span of Time.
+        """
+        apply_velocity(self.array_position, self.array_velocity, time)
+
+    def spin(self, time: float):
+        """Advance the Headings of every Object in this Domain by their
+            Rotations over a span of Time.
+        """
+        apply_spin(self.space._hdg_rot[self.index], time)
+
+    def gravitate(self, mass: float, time: float = 1):
+        """Accelerate every Object in this Domain over a span of Time, toward a
+            Body of a given Mass, in Kilograms, at the Origin.
+        """
+        apply_gravity(self.array_position, self.array_velocity, G * mass, time)
 
     def __getitem__(self, idx: int) -> "Coordinates":
         return tuple(ls for ls in Coordinates.ALL if ls.index == idx)[0]
@@ -271,7 +463,7 @@ class Coordinates(object):
         paired with a Rotation.
     """
 
-    ALL: List["Coordinates"] = []
+    ALL: "WeakSet[Coordinates]" = WeakSet()
 
     def __init__(self, domain: Optional[LocalSpace], add_values: bool = True):
         self.domain: Optional[LocalSpace] = domain
@@ -292,7 +484,7 @@ class Coordinates(object):
         else:
             self.index: int = -1
 
-        self.ALL.append(proxy(self, self.free_wr))
+        self.ALL.add(self)
 
     @property
     def type(self) -> Tuple[type, type]:
@@ -334,26 +526,15 @@ class Coordinates(object):
         self._position: base.Position = pos
         self._rotation: base.Rotation = rot
 
-        def dset(newdomain: LocalSpace):
-            self.domain = newdomain
-
-        self._position.domain = self._rotation.domain = property(
-            (lambda: self.domain), dset
-        )
+        # Weak, so that the FoRs do not keep these Coordinates alive.
+        self._position._owner = self._rotation._owner = ref(self)
 
     def free(self):
-        if self.index in self.domain.used:
-            self.domain.used.remove(self.index)
+        self.domain.release_index(self.index)
 
         self.domain = None
         self.index = -1
 
-    def free_wr(self, prox):
-        if prox in self.ALL:
-            self.ALL.remove(prox)
-
-        self.free()
-
     def detach(self):
         self._position = self._position.clone()
         self._rotation = self._rotation.clone()
@@ -368,15 +549,23 @@ class Coordinates(object):
         """Return a new Coordinates, from the perspective of a given frame of
             reference.
         """
+        undo = rotation.undo(pov._rotation.heading.components)
+
         new = Coordinates(None, False)
         new.set_posrot(
             position.Virtual(
-                self._position.position - pov._position.position,
-                self._position.velocity - pov._position.velocity,
+                rotation.apply(
+                    undo, self._position.position - pov._position.position
+                ),
+                rotation.apply(
+                    undo, self._position.velocity - pov._position.velocity
+                ),
             ),
             rotation.Virtual(
-                self._rotation.heading / pov._rotation.heading,
-                self._rotation.rotate / pov._rotation.heading,
+                quaternion(
+                    *rotation.multiply(self._rotation.heading.components, undo)
+                ),
+                quaternion(0, *rotation.apply(undo, self._rotation.rotate.vec)),
             ),
         )
         return new
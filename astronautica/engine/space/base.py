@@ -8,7 +8,31 @@ from .geometry import from_cylindrical, from_spherical, to_cylindrical, to_spher
 
 
 class Position(ABC):
-    __slots__ = ("domain", "unit")
+    __slots__ = ("_domain", "_owner", "unit")
+
+    def __init_subclass__(cls, **kw):
+        super().__init_subclass__(**kw)
+        # Kept for Serialization, rather than looked up on every call.
+        cls._type_name: str = cls.__name__
+
+    @property
+    def domain(self):
+        """The Domain of the Coordinates that own this FoR, if it is owned, or
+            else the Domain it was given directly.
+        """
+        owner = getattr(self, "_owner", None)
+        if owner is not None:
+            coords = owner()
+            return coords and coords.domain
+        return self._domain
+
+    @domain.setter
+    def domain(self, value) -> None:
+        owner = getattr(self, "_owner", None)
+        if owner is not None and (coords := owner()) is not None:
+            coords.domain = value
+        else:
+            self._domain = value
 
     @property
     @abstractmethod
@@ -76,7 +100,7 @@ class Position(ABC):
 
     def serialize(self):
         flat = {
-            "type": type(self).__name__,
+            "type": self._type_name,
             "data": {
                 "pos": list(self.position),
                 "vel": list(self.velocity),
@@ -86,6 +110,32 @@ class Position(ABC):
 
 
 class Rotation(ABC):
+    __slots__ = ("_domain", "_owner")
+
+    def __init_subclass__(cls, **kw):
+        super().__init_subclass__(**kw)
+        # Kept for Serialization, rather than looked up on every call.
+        cls._type_name: str = cls.__name__
+
+    @property
+    def domain(self):
+        """The Domain of the Coordinates that own this FoR, if it is owned, or
+            else the Domain it was given directly.
+        """
+        owner = getattr(self, "_owner", None)
+        if owner is not None:
+            coords = owner()
+            return coords and coords.domain
+        return self._domain
+
+    @domain.setter
+    def domain(self, value) -> None:
+        owner = getattr(self, "_owner", None)
+        if owner is not None and (coords := owner()) is not None:
+            coords.domain = value
+        else:
+            self._domain = value
+
     @property
     @abstractmethod
     def heading(self) -> quaternion:
@@ -108,10 +158,10 @@ class Rotation(ABC):
 
     def serialize(self):
         flat = {
-            "type": type(self).__name__,
+            "type": self._type_name,
             "data": {
-                "hdg": list(self.heading),
-                "rot": list(self.rotate),
+                "hdg": self.heading.components.tolist(),
+                "rot": self.rotate.components.tolist(),
             },
         }
         return flat
@@ -1,7 +1,7 @@
-from math import degrees, radians
+from math import acos, atan2, cos, degrees, pi, radians, sin, sqrt
 from typing import Tuple, Type, Union
 
-from numba import jit
+from numba import guvectorize, jit, prange
 import numpy as np
 from quaternion import quaternion
 from vectormath import Vector3
@@ -26,47 +26,145 @@ NADIR = Vector3(0, 0, -1)
 ###===---
 
 
-@jit(nopython=True)
+@jit(nopython=True, cache=True, fastmath=True)
 def to_spherical(x: float, y: float, z: float) -> Tuple[float, float, float]:
     """Convert three-dimensional Cartesian Coordinates to Spherical."""
-    rho = np.sqrt(np.sum(np.square(np.array((x, y, z)))))
-    theta = 90 - degrees(np.arccos(z / rho)) if rho else 0
+    rho = sqrt(x * x + y * y + z * z)
+    theta = 90 - degrees(acos(z / rho)) if rho else 0
     phi = (
         0
         if theta == 90 or theta == -90
-        else (270 - degrees(np.arctan2(y, x))) % 360 - 180
+        else (270 - degrees(atan2(y, x))) % 360 - 180
     )
     return rho, theta, phi
 
 
-@jit(nopython=True)
+@jit(nopython=True, cache=True, fastmath=True)
 def from_spherical(rho: float, theta: float, phi: float) -> Tuple[float, float, float]:
     """Convert three-dimensional Spherical Coordinates to Cartesian."""
-    theta = np.pi / 2 - radians(theta)
+    theta = pi / 2 - radians(theta)
     phi_ = radians(phi)
-    y = rho * np.cos(phi_) * np.sin(theta)
-    x = rho * np.sin(phi_) * np.sin(theta)
-    z = rho * np.cos(theta)
+    y = rho * cos(phi_) * sin(theta)
+    x = rho * sin(phi_) * sin(theta)
+    z = rho * cos(theta)
     return x, y, z
 
 
-@jit(nopython=True)
+@jit(nopython=True, cache=True, fastmath=True)
 def to_cylindrical(x: float, y: float, z: float) -> Tuple[float, float, float]:
     """Convert three-dimensional Cartesian Coordinates to Cylindrical."""
-    rho = np.sqrt(np.sum(np.square(np.array((x, y)))))
-    phi = np.arctan2(y, x)
+    rho = sqrt(x * x + y * y)
+    phi = atan2(y, x)
     return rho, phi, z
 
 
-@jit(nopython=True)
+@jit(nopython=True, cache=True, fastmath=True)
 def from_cylindrical(rho: float, phi: float, z: float) -> Tuple[float, float, float]:
     """Convert three-dimensional Cylindrical Coordinates to Cartesian."""
     phi_ = radians(phi)
-    x = rho * np.cos(phi_)
-    y = rho * np.sin(phi_)
+    x = rho * cos(phi_)
+    y = rho * sin(phi_)
     return x, y, z
 
 
+def _triples(xyz) -> np.ndarray:
+    """Return an Array of Coordinates, after making sure it is shaped (..., 3).
+        The Kernels below accept any length of last Axis, but only read the
+        first three Components.
+    """
+    xyz = np.asarray(xyz)
+    if xyz.shape[-1:] != (3,):
+        raise ValueError(f"Expected Coordinates shaped (..., 3), not {xyz.shape}.")
+    return xyz
+
+
+@guvectorize(["void(f8[:], f8[:])"], "(n)->(n)", nopython=True, cache=True)
+def _to_spherical_kernel(xyz: np.ndarray, out: np.ndarray):
+    rho, theta, phi = to_spherical(xyz[0], xyz[1], xyz[2])
+    out[0] = rho
+    out[1] = theta
+    out[2] = phi
+
+
+@guvectorize(["void(f8[:], f8[:])"], "(n)->(n)", nopython=True, cache=True)
+def _to_cylindrical_kernel(xyz: np.ndarray, out: np.ndarray):
+    rho, phi, z = to_cylindrical(xyz[0], xyz[1], xyz[2])
+    out[0] = rho
+    out[1] = phi
+    out[2] = z
+
+
+def to_spherical_batch(xyz: np.ndarray) -> np.ndarray:
+    """Convert an Array of three-dimensional Cartesian Coordinates, shaped
+        (..., 3), to Spherical. Raise ValueError for any other Shape.
+    """
+    return _to_spherical_kernel(_triples(xyz))
+
+
+def to_cylindrical_batch(xyz: np.ndarray) -> np.ndarray:
+    """Convert an Array of three-dimensional Cartesian Coordinates, shaped
+        (..., 3), to Cylindrical. Raise ValueError for any other Shape.
+    """
+    return _to_cylindrical_kernel(_triples(xyz))
+
+
+def from_spherical_batch(rho, theta, phi) -> np.ndarray:
+    """Convert Arrays of three-dimensional Spherical Coordinates to Cartesian.
+        Arguments are broadcast together, and the result is shaped (..., 3).
+    """
+    theta = np.pi / 2 - np.radians(theta)
+    phi_ = np.radians(phi)
+    sin_theta = np.sin(theta)
+    return np.stack(
+        np.broadcast_arrays(
+            rho * np.sin(phi_) * sin_theta,
+            rho * np.cos(phi_) * sin_theta,
+            rho * np.cos(theta),
+        ),
+        axis=-1,
+    )
+
+
+@jit(nopython=True, parallel=True, fastmath=True, cache=True)
+def apply_velocity(position: np.ndarray, velocity: np.ndarray, time: float) -> None:
+    """Given Arrays of Positions and Velocities, shaped (..., 3), advance every
+        Position by its Velocity over a span of Time, in place.
+    """
+    pos = position.reshape((-1, 3))
+    vel = velocity.reshape((-1, 3))
+
+    for i in prange(pos.shape[0]):
+        pos[i, 0] += vel[i, 0] * time
+        pos[i, 1] += vel[i, 1] * time
+        pos[i, 2] += vel[i, 2] * time
+
+
+@jit(nopython=True, parallel=True, fastmath=True, cache=True)
+def apply_gravity(
+    position: np.ndarray, velocity: np.ndarray, gm: float, time: float
+) -> None:
+    """Given Arrays of Positions and Velocities, shaped (..., 3), accelerate
+        every Velocity toward the Origin over a span of Time, as if pulled by a
+        Body at the Origin whose Mass multiplied by G is GM. Positions at the
+        Origin are left alone.
+    """
+    pos = position.reshape((-1, 3))
+    vel = velocity.reshape((-1, 3))
+
+    for i in prange(pos.shape[0]):
+        x = pos[i, 0]
+        y = pos[i, 1]
+        z = pos[i, 2]
+        r2 = x * x + y * y + z * z
+
+        if r2 > 0:
+            # a = GM/r², along -r/|r|.
+            scale = gm * time / (r2 * np.sqrt(r2))
+            vel[i, 0] -= x * scale
+            vel[i, 1] -= y * scale
+            vel[i, 2] -= z * scale
+
+
 ###===---
 # QUATERNION FUNCTIONS
 # Huge thanks to aeroeng15 for help with this.
@@ -105,6 +203,50 @@ def rotate_vector(vector: Vector3, rotor: quaternion) -> Vector3:
     return vector_out
 
 
+@jit(nopython=True, parallel=True, fastmath=True, cache=True)
+def apply_spin(hdg_rot: np.ndarray, time: float) -> None:
+    """Given an Array of Headings and Rotations, shaped (..., 8) and stored as
+        Floats, with each Heading in the first four Columns and its Rotation in
+        the last four, turn every Heading by its Rotation over a span of Time,
+        in place.
+
+    The vector part of a Rotation is its angular velocity, ω, in Radians per
+        second; Its real part is ignored. Over Time, the Heading is turned by
+        the Rotor of Angle |ω|·Time about the Axis ω/|ω|.
+    """
+    hr = hdg_rot.reshape((-1, 8))
+
+    for i in prange(hr.shape[0]):
+        ox = hr[i, 5]
+        oy = hr[i, 6]
+        oz = hr[i, 7]
+        omega = np.sqrt(ox * ox + oy * oy + oz * oz)
+
+        half = omega * time / 2
+        # sin(half)/omega, as (time/2)·sinc(half), which stays accurate as the
+        #   Angle approaches Zero, where it falls back to a Taylor Series.
+        if abs(half) > 1e-6:
+            scale = np.sin(half) / omega
+        else:
+            scale = time / 2 * (1 - half * half / 6)
+
+        aw = np.cos(half)
+        ax = ox * scale
+        ay = oy * scale
+        az = oz * scale
+
+        bw = hr[i, 0]
+        bx = hr[i, 1]
+        by = hr[i, 2]
+        bz = hr[i, 3]
+
+        # Hamilton Product.
+        hr[i, 0] = aw * bw - ax * bx - ay * by - az * bz
+        hr[i, 1] = aw * bx + ax * bw + ay * bz - az * by
+        hr[i, 2] = aw * by - ax * bz + ay * bw + az * bx
+        hr[i, 3] = aw * bz + ax * by - ay * bx + az * bw
+
+
 @jit(nopython=True)
 def facing(quat) -> Vector3:
     """Given a Unit Quaternion, return the Unit Vector of its direction."""
@@ -1,5 +1,7 @@
 """Position Module: Dedicated to simple locations in three-dimensional Space."""
 
+from typing import Tuple
+
 from astropy import units as u
 import numpy as np
 from vectormath import Vector3
@@ -8,19 +10,41 @@ from .base import Position
 
 
 class Pointer(Position):
-    __slots__ = ("index",)
+    __slots__ = ("_rows", "index")
 
     def __init__(self, domain, index: int, *, unit: u.Unit = u.meter):
         self.domain = domain
         self.index: int = index
         self.unit = unit
 
+        self._rows = None
+
+    @property
+    def rows(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the Position and Velocity Arrays of the Domain of this FoR.
+
+        The Arrays are Views into the Space, kept until the Domain changes or
+            the Space replaces its Arrays.
+        """
+        domain = self.domain
+        rows = self._rows
+
+        if rows is None or rows[0] is not domain or rows[1] != domain.space.version:
+            rows = self._rows = (
+                domain,
+                domain.space.version,
+                domain.array_position,
+                domain.array_velocity,
+            )
+
+        return rows[2:]
+
     @property
     def position(self) -> Vector3:
         """Go into the relevant Space structure and retrieve the Position that
-            is assigned to this FoR, and wrap it in a Vector3.
+            is assigned to this FoR, as a Vector3 View of the Space Array.
         """
-        return Vector3(self.domain.array_position[self.index])
+        return self.rows[0][self.index].view(Vector3)
 
     @position.setter
     def position(self, v: np.ndarray):
@@ -28,14 +52,14 @@ class Pointer(Position):
 
         If a Scalar is given, all values of the Array will be that value.
         """
-        self.domain.array_position[self.index] = v
+        self.rows[0][self.index] = v
 
     @property
     def velocity(self) -> Vector3:
         """Go into the relevant Space structure and retrieve the Velocity that
-            is assigned to this FoR, and wrap it in a Vector3.
+            is assigned to this FoR, as a Vector3 View of the Space Array.
         """
-        return Vector3(self.domain.array_velocity[self.index])
+        return self.rows[1][self.index].view(Vector3)
 
     @velocity.setter
     def velocity(self, v: np.ndarray):
@@ -43,15 +67,17 @@ class Pointer(Position):
 
         If a Scalar is given, all values of the Array will be that value.
         """
-        self.domain.array_velocity[self.index] = v
+        self.rows[1][self.index] = v
 
     def clone(self: Position) -> "Virtual":
         return Virtual(self.position, self.velocity, unit=self.unit)
 
 
 class Virtual(Position):
-    """Virtual Position object: Track information as Vector3 and return
+    """Virtual Position object: Track information as NumPy Arrays and return
         transformations as requested, WITHOUT registering into a Space.
+
+    Values are copied in as plain Arrays, and only viewed as Vector3 when read.
     """
 
     __slots__ = (
@@ -61,34 +87,34 @@ class Virtual(Position):
 
     def __init__(
         self,
-        pos: Vector3 = Vector3(0, 0, 0),
-        vel: Vector3 = Vector3(0, 0, 0),
+        pos: np.ndarray = (0, 0, 0),
+        vel: np.ndarray = (0, 0, 0),
         *,
         unit: u.Unit = u.meter,
     ):
         # Physical location.
-        self._pos: Vector3 = pos
+        self._pos: np.ndarray = np.array(pos, dtype=float)
         # Change in location per second.
-        self._vel: Vector3 = vel
+        self._vel: np.ndarray = np.array(vel, dtype=float)
 
         self.domain = None
         self.unit = unit
 
     @property
     def position(self) -> Vector3:
-        return self._pos
+        return self._pos.view(Vector3)
 
     @position.setter
     def position(self, value: np.ndarray):
-        self._pos: Vector3 = Vector3(value)
+        self._pos: np.ndarray = np.array(value, dtype=float)
 
     @property
     def velocity(self) -> Vector3:
-        return self._vel
+        return self._vel.view(Vector3)
 
     @velocity.setter
     def velocity(self, value: np.ndarray):
-        self._vel: Vector3 = Vector3(value)
+        self._vel: np.ndarray = np.array(value, dtype=float)
 
     def clone(self: Position) -> "Virtual":
         return Virtual(self.position, self.velocity, unit=self.unit)
@@ -2,36 +2,92 @@
     Space.
 """
 
+import numpy as np
 from quaternion import quaternion
 
 from .base import Rotation
 
 
-class Pointer(Rotation):
-    __slots__ = (
-        "domain",
-        "index",
+def apply(q: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Rotate Vectors, shaped (..., 3), by Unit Quaternions given as Floats,
+        shaped (..., 4).
+
+    v' = v + w·t + u×t, where t = 2(u×v), and u is the vector part of q. This
+        needs two Cross Products, rather than the two full Quaternion Products
+        of q·v·q⁻¹.
+    """
+    q = np.asarray(q, dtype=float)
+    v = np.asarray(v, dtype=float)
+    w = q[..., 0:1]
+    u = q[..., 1:]
+    t = 2 * np.cross(u, v)
+    return v + w * t + np.cross(u, t)
+
+
+def multiply(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """Take the Hamilton Products of Quaternions given as Floats, shaped
+        (..., 4), broadcasting them together.
+    """
+    p = np.asarray(p, dtype=float)
+    q = np.asarray(q, dtype=float)
+    pw, px, py, pz = np.moveaxis(p, -1, 0)
+    qw, qx, qy, qz = np.moveaxis(q, -1, 0)
+    return np.stack(
+        (
+            pw * qw - px * qx - py * qy - pz * qz,
+            pw * qx + px * qw + py * qz - pz * qy,
+            pw * qy - px * qz + py * qw + pz * qx,
+            pw * qz + px * qy - py * qx + pz * qw,
+        ),
+        axis=-1,
     )
 
+
+def undo(q: np.ndarray) -> np.ndarray:
+    """Return the Quaternion, as Floats shaped (4,), which undoes a Heading,
+        given as Floats. The Heading is scaled to Unit length first, so the
+        Conjugate is its true Inverse. A Heading of zero length is taken as
+        the Identity.
+    """
+    q = np.asarray(q, dtype=float)
+    norm = np.sqrt(np.dot(q, q))
+    if norm == 0:
+        return np.array((1.0, 0.0, 0.0, 0.0))
+    return q * (1, -1, -1, -1) / norm
+
+
+def components(value):
+    return value.components if isinstance(value, quaternion) else value
+
+
+class Pointer(Rotation):
+    __slots__ = ("index",)
+
     def __init__(self, domain, index: int):
         self.domain = domain
         self.index: int = index
 
     @property
     def heading(self) -> quaternion:
-        return self.domain.quat_heading[self.index]
+        """Go into the relevant Space structure and build a Quaternion from the
+            Heading that is assigned to this FoR.
+        """
+        return quaternion(*self.domain.heading_f[self.index])
 
     @heading.setter
     def heading(self, value: quaternion) -> None:
-        self.domain.quat_heading[self.index] = value
+        self.domain.heading_f[self.index] = components(value)
 
     @property
     def rotate(self) -> quaternion:
-        return self.domain.quat_rotate[self.index]
+        """Go into the relevant Space structure and build a Quaternion from the
+            Rotation that is assigned to this FoR.
+        """
+        return quaternion(*self.domain.rotate_f[self.index])
 
     @rotate.setter
     def rotate(self, value: quaternion) -> None:
-        self.domain.quat_rotate[self.index] = value
+        self.domain.rotate_f[self.index] = components(value)
 
     def clone(self: Rotation) -> "Virtual":
         return Virtual(self.heading, self.rotate)
@@ -49,6 +105,8 @@ class Virtual(Rotation):
         # Spin per second.
         self._rot = rot
 
+        self.domain = None
+
     @property
     def heading(self) -> quaternion:
         return self._hdg
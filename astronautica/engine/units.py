@@ -16,9 +16,18 @@ class Units(NamedTuple):
     distance: u.Unit = u.meter
     mass: u.Unit = u.kg
 
+    # Scale Factors to SI, for use in arithmetic without Astropy.
+    distance_m: float = 1.0
+    mass_kg: float = 1.0
+
+    @classmethod
+    def from_units(cls, distance: u.Unit, mass: u.Unit) -> "Units":
+        """Build a Units Tuple, computing its SI Scale Factors once."""
+        return cls(distance, mass, distance.to(u.meter), mass.to(u.kg))
+
 
 UNITS_LOCAL = Units()
-UNITS_PLANET = Units(u.km, u.M_earth)
-UNITS_GIANT = Units(u.km, u.M_jup)
-UNITS_STAR = Units(u.au, u.M_sun)
-UNITS_GALACTIC = Units(u.lyr, u.M_sun)
+UNITS_PLANET = Units.from_units(u.km, u.M_earth)
+UNITS_GIANT = Units.from_units(u.km, u.M_jup)
+UNITS_STAR = Units.from_units(u.au, u.M_sun)
+UNITS_GALACTIC = Units.from_units(u.lyr, u.M_sun)
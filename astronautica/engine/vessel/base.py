@@ -1,5 +1,4 @@
 from collections import deque
-from itertools import compress
 from typing import Deque, Sequence, Tuple, Dict
 
 from ..objects import Object
@@ -17,36 +16,62 @@ class Vessel(object):
 
         self.sections: Dict[str, Section] = {}
         for sys in sections:
-            # name__ = type(sys).__name__
-
             if (name__ := type(sys).__name__) in self.sections:
                 raise ValueError("Multiple {!r} Subsystems".format(name__))
             else:
                 self.sections[name__] = sys
 
+        # Sections are never added or removed after construction.
+        self._sections_tuple: Tuple[Section, ...] = tuple(self.sections.values())
+
+        self._stats: Tuple[int, ...] = ()
+        self._stats_gen: int = -1
+
+    def _aggregate(self) -> Tuple[int, ...]:
+        """Return the Crew and Equipment totals of all Sections, summed in one
+            pass, and kept until the Staff of any Section changes.
+        """
+        gen = sum(sec.staff.gen for sec in self._sections_tuple)
+
+        if gen != self._stats_gen:
+            totals = [0] * 6
+            for sec in self._sections_tuple:
+                staff = sec.staff
+                totals[0] += staff.crew
+                totals[1] += staff.crew_hurt
+                totals[2] += staff.crew_dead
+                totals[3] += staff.equip
+                totals[4] += staff.equip_damaged
+                totals[5] += staff.equip_destroy
+
+            self._stats = tuple(totals)
+            self._stats_gen = gen
+
+        return self._stats
+
     @property
     def crew(self) -> int:
-        return sum(sec.staff.crew for sec in self.sections.values())
+        return self._aggregate()[0]
 
     @property
     def crew_hurt(self) -> int:
-        return sum(sec.staff.crew_hurt for sec in self.sections.values())
+        return self._aggregate()[1]
 
     @property
     def crew_dead(self) -> int:
-        return sum(sec.staff.crew_dead for sec in self.sections.values())
+        return self._aggregate()[2]
 
     @property
     def equip(self) -> int:
-        return sum(sec.staff.equip for sec in self.sections.values())
+        return self._aggregate()[3]
 
     @property
     def equip_damaged(self) -> int:
-        return sum(sec.staff.equip_damaged for sec in self.sections.values())
+        return self._aggregate()[4]
 
     @property
     def equip_destroy(self) -> int:
-        return sum(sec.staff.equip_destroy for sec in self.sections.values())
+        return self._aggregate()[5]
 
     @property
     def frame(self) -> Coordinates:
@@ -59,9 +84,13 @@ class Vessel(object):
             self.orders.insert(idx, order)
 
     def exec_queue(self) -> Tuple[bool, ...]:
-        res = tuple(self.execute(order) for order in self.orders)
-        self.orders[:] = tuple(compress(self.orders, res))
-        return res
+        res = []
+        for _ in range(len(self.orders)):
+            order = self.orders.popleft()
+            res.append(keep := self.execute(order))
+            if keep:
+                self.orders.append(order)
+        return tuple(res)
 
     def execute(self, order: str) -> bool:
         ...
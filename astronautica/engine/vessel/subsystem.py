@@ -1,7 +1,37 @@
 from abc import ABC, abstractmethod
-from secrets import randbelow
+from typing import Tuple
 
 from attr import attrs
+import numpy as np
+
+
+def wound(intact: int, worn: int, number: int, rng) -> Tuple[int, int]:
+    """Apply a Number of Hits to a Population, each striking a random intact
+        Member. A Hit on a worn Member destroys it; A Hit on a fine Member
+        wears it. The random Values for all Hits are drawn in one Batch, but
+        the Hits are still applied one at a time, so that each one sees the
+        Population as the previous one left it.
+
+    Return the Number of worn Members and the Number newly destroyed.
+    """
+    lost = 0
+    for roll in rng.random(number).tolist():
+        if intact <= 0:
+            break
+        elif roll * intact < worn:
+            worn -= 1
+            intact -= 1
+            lost += 1
+        else:
+            worn += 1
+
+    return worn, lost
+
+
+# Fields of Staff that the Totals of a Vessel are computed from.
+COUNTS = frozenset(
+    ("crew", "equip", "crew_hurt", "crew_dead", "equip_damaged", "equip_destroy")
+)
 
 
 @attrs
@@ -17,6 +47,19 @@ class Staff(object):
     work: int = 0
     work_goal: int = 2
 
+    # Incremented by every change to the Crew or Equipment totals.
+    gen: int = 0
+
+    # Shared by all Staff, to avoid reseeding for every Section.
+    rng = np.random.default_rng()
+
+    def __setattr__(self, name: str, value) -> None:
+        # Vessels cache their totals by Generation, so any write to a Count,
+        #   including a direct Assignment, must bump it.
+        if name in COUNTS:
+            object.__setattr__(self, "gen", getattr(self, "gen", 0) + 1)
+        object.__setattr__(self, name, value)
+
     @property
     def crew_fine(self) -> int:
         return max(self.crew - (self.crew_hurt + self.crew_dead), 0)
@@ -38,22 +81,16 @@ class Staff(object):
         return min(self.crew_fine, self.equip_fine)
 
     def injure(self, number: int):
-        for i in range(number):
-            if self.crew_alive > 0:
-                if randbelow(self.crew_alive) < self.crew_hurt:
-                    self.crew_hurt -= 1
-                    self.crew_dead += 1
-                else:
-                    self.crew_hurt += 1
+        self.crew_hurt, dead = wound(
+            self.crew_alive, self.crew_hurt, number, self.rng
+        )
+        self.crew_dead += dead
 
     def damage(self, number: int):
-        for i in range(number):
-            if self.equip_intact > 0:
-                if randbelow(self.equip_intact) < self.equip_damaged:
-                    self.equip_damaged -= 1
-                    self.equip_destroy += 1
-                else:
-                    self.equip_damaged += 1
+        self.equip_damaged, destroyed = wound(
+            self.equip_intact, self.equip_damaged, number, self.rng
+        )
+        self.equip_destroy += destroyed
 
     def work_points(self) -> int:
         points, self.work = divmod(self.work + self.work_capable, self.work_goal)
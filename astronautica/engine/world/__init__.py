@@ -1,10 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from secrets import choice
+from secrets import randbelow, token_bytes
 from typing import Dict, Optional, Tuple, Union
 from uuid import UUID, uuid4
 
 import numpy as np
-from numpy.linalg import norm
 from yaml import safe_dump, safe_load
 
 from ..rendering import render_galaxy
@@ -17,7 +17,41 @@ from util.storage import PersistentDict
 
 
 DELIM = "|"
-LINE = (DELIM.join((*(["{: = 23}"] * 3), "{}")) + "\n").format
+MASK_64 = (1 << 64) - 1
+
+
+def random_ids(n: int) -> np.ndarray:
+    """Generate N random Version 4 UUIDs, in one Draw, as an Array of their
+        high and low halves, shaped (N, 2).
+    """
+    ids = np.frombuffer(token_bytes(16 * n), dtype=np.uint64).reshape(n, 2).copy()
+    # Set the Version and Variant Bits, exactly as uuid4() would.
+    ids[:, 0] = ids[:, 0] & np.uint64(~0xF000 & MASK_64) | np.uint64(0x4000)
+    ids[:, 1] = ids[:, 1] & np.uint64(MASK_64 >> 2) | np.uint64(1 << 63)
+    return ids
+
+
+def join_ids(halves: np.ndarray) -> list:
+    """Rebuild 128-bit Integer IDs from an Array of their halves."""
+    return [hi << 64 | lo for hi, lo in halves.tolist()]
+
+
+def save_array(path: Path, array: np.ndarray):
+    """Write an Array to a NPY File, by way of a temporary File. An Array that
+        is already mapped from that File only needs to be flushed.
+    """
+    if (
+        isinstance(array, np.memmap)
+        and Path(array.filename).resolve() == path.resolve()
+    ):
+        if array.flags.writeable:
+            array.flush()
+        return
+
+    tmp = path.with_suffix(".TMP")
+    with tmp.open("wb") as fd:
+        np.save(fd, array)
+    tmp.rename(path)
 
 
 class SystemHandler(object):
@@ -50,8 +84,11 @@ class SystemHandler(object):
 
 class Galaxy(object):
     __slots__ = (
+        "_by_id",
+        "_dir_ok",
         "gdir",
         "gid",
+        "ids",
         "loaded",
         "obj",
         "stars",
@@ -64,35 +101,72 @@ class Galaxy(object):
         if path.is_dir():
             p_data = path / cfg["data/meta", "meta.yml"]
             p_stars = path / cfg["data/stars", "STARS"]
+            p_ids = path / cfg["data/ids", "IDS"]
         else:
             raise NotADirectoryError(path)
 
         with p_data.open("r") as f:
             data = safe_load(f)
 
-        def stream():
-            with p_stars.open("r") as file:
-                for line in file:
-                    if line.count(DELIM) == 3:
-                        x, y, z, h = line.strip("\n").replace(" ", "").split(DELIM)
-                        yield float(x), float(y), float(z), UUID(hex=h).int
-
-        stars = np.array(list(stream()))
-        return cls(stars, path, UUID(hex=data["uuid"]))
+        npy_stars = p_stars.with_suffix(".npy")
+        npy_ids = p_ids.with_suffix(".npy")
+
+        # A Save or Upgrade may have been interrupted between writing the two
+        #   Arrays. Only use them if both are there.
+        if npy_stars.exists() and npy_ids.exists():
+            stars = np.load(npy_stars, mmap_mode="r")
+            ids = np.load(npy_ids, mmap_mode="r")
+        elif not p_stars.exists():
+            raise FileNotFoundError(
+                f"Galaxy at {path} has no Star Table: Expected both {npy_stars.name}"
+                f" and {npy_ids.name}, or a legacy {p_stars.name} to rebuild them."
+            )
+        else:
+            # Legacy Text Table. Parse every Field at once, and remove the
+            #   sign-aware Padding it was written with.
+            raw = np.char.replace(
+                np.loadtxt(p_stars, dtype=str, delimiter=DELIM, ndmin=2), " ", ""
+            )
+            stars = raw[:, :3].astype(float)
+            # Decode every Hex UUID at once. Read as big-endian, the Bytes of
+            #   each UUID are exactly its high and then its low half.
+            ids = (
+                np.frombuffer(bytes.fromhex("".join(raw[:, 3])), dtype=">u8")
+                .astype(np.uint64)
+                .reshape(-1, 2)
+            )
+
+            # Upgrade to the binary Format, so that this is only done once.
+            save_array(npy_stars, stars)
+            save_array(npy_ids, ids)
+
+        return cls(stars, ids, path, UUID(hex=data["uuid"]))
 
     @classmethod
     def generate(cls, *a, name: str = None, **kw) -> "Galaxy":
         uuid = uuid4()
 
-        stars = np.concatenate(generate_galaxy(*a, **kw))
-        stars = np.concatenate((stars, [[uuid4().int] for _ in stars]), 1)
+        stars = generate_galaxy(*a, **kw)
+        ids = random_ids(len(stars))
 
-        return cls(stars, Path(cfg["data/directory"], "world", name or uuid.hex), uuid)
+        return cls(
+            stars, ids, Path(cfg["data/directory"], "world", name or uuid.hex), uuid
+        )
 
-    def __init__(self, stars: np.ndarray, gdir: Path, gid: UUID):
+    def __init__(self, stars: np.ndarray, ids: np.ndarray, gdir: Path, gid: UUID):
+        """Stars are kept as two Arrays of matching length: Their Coordinates,
+            shaped (N, 3), and the halves of their 128-bit UUIDs, shaped (N, 2).
+        """
         self.stars = stars
+        self.ids = ids
         self.gdir = gdir
         self.gid = gid
+        self._dir_ok: bool = False
+
+        # Row Index of every Star, by its Integer UUID.
+        self._by_id: Dict[int, int] = {
+            uid: i for i, uid in enumerate(join_ids(self.ids))
+        }
 
         self.loaded: Dict[int, SystemHandler] = {}
         self.obj = PersistentDict(
@@ -100,12 +174,21 @@ class Galaxy(object):
         )
 
     def ensure(self):
+        """Make sure the Galaxy Directory, and the Systems Directory within it,
+            exist. The Filesystem is only checked until this first succeeds.
+        """
+        if self._dir_ok:
+            return
+
         if self.gdir.exists():
             if not self.gdir.is_dir():
                 raise NotADirectoryError(self.gdir)
         else:
             self.gdir.mkdir()
 
+        (self.gdir / "systems").mkdir(exist_ok=True)
+        self._dir_ok = True
+
     def get_system(self, uuid: UUID) -> SystemHandler:
         """Retrieve a Star System by its UUID. If the System does not exist,
             procedurally generate it on the fly.
@@ -120,9 +203,7 @@ class Galaxy(object):
         dat = self.system_by_uuid(uuid)
 
         if dat:
-            systems = self.gdir / "systems"
-            systems.mkdir(exist_ok=True)
-            fp = (systems / uuid_h).with_suffix(".json")
+            fp = (self.gdir / "systems" / uuid_h).with_suffix(".json")
 
             system = SystemHandler(fp, dat)
 
@@ -132,18 +213,20 @@ class Galaxy(object):
             raise FileNotFoundError(f"System {uuid_h!r} not found in Galaxy.")
 
     def unload_system(self, system: SystemHandler) -> bool:
-        if system.uuid in self.loaded:
-            system.sync()
-            del self.loaded[system.uuid]
-            return True
-        else:
-            return False
+        popped = self.loaded.pop(system.uuid, None)
+        if popped is not None:
+            popped.sync()
+        return popped is not None
 
     def unload_all(self) -> int:
-        return sum(1 for x in map(self.unload_system, self.loaded.values()) if x)
+        n = len(self.loaded)
+        for system in self.loaded.values():
+            system.sync()
+        self.loaded.clear()
+        return n
 
     def render(self, *a, **kw):
-        render_galaxy(self.stars[..., :3], *a, **kw)
+        render_galaxy(self.stars, *a, **kw)
 
     def rename(self, target: Path):
         if not target.exists():
@@ -156,36 +239,47 @@ class Galaxy(object):
     def save(self):
         p_data = self.gdir / cfg["data/meta", "meta.yml"]
         p_stars = self.gdir / cfg["data/stars", "STARS"]
+        p_ids = self.gdir / cfg["data/ids", "IDS"]
         self.ensure()
 
-        for system in self.loaded.values():
-            system.sync()
+        if len(self.loaded) > 1:
+            # Each Sync is mostly File IO, so they can overlap in Threads.
+            with ThreadPoolExecutor(min(32, len(self.loaded))) as pool:
+                for _ in pool.map(SystemHandler.sync, self.loaded.values()):
+                    pass
+        else:
+            for system in self.loaded.values():
+                system.sync()
 
         tmp = p_data.with_suffix(".TMP")
         with tmp.open("w") as fd:
             safe_dump({"uuid": self.gid.hex}, fd)
         tmp.rename(p_data)
 
-        tmp = p_stars.with_suffix(".TMP")
-        with tmp.open("w") as fd:
-            fd.writelines(LINE(*star[:3], UUID(int=star[3]).hex) for star in self.stars)
-        tmp.rename(p_stars)
+        save_array(p_stars.with_suffix(".npy"), self.stars)
+        save_array(p_ids.with_suffix(".npy"), self.ids)
 
         return self.gdir
 
     def systems_at(
         self, pos: np.ndarray, radius: float = 0
     ) -> Tuple[Tuple[float, float, float, int], ...]:
-        return tuple(x for x in self.stars if norm(x[:3] - pos) <= radius)
+        diff = self.stars - pos
+        # Compare squared Distances, rather than taking a Root for every Star.
+        mask = np.einsum("ij,ij->i", diff, diff) <= radius * radius
+        return tuple(
+            (*xyz, uid)
+            for xyz, uid in zip(self.stars[mask].tolist(), join_ids(self.ids[mask]))
+        )
 
     def system_by_uuid(self, uuid: UUID) -> Optional[Tuple[float, float, float, int]]:
-        # Find Indices of all Stars with a matching UUID.
-        indices = np.where(self.stars[..., 3] == uuid.int)[0].tolist()
-        if indices:
-            # Return the Data at the first Index.
-            return tuple(self.stars[indices[0]].tolist())
-        else:
-            return None
+        i = self._by_id.get(uuid.int)
+        return None if i is None else self.star(i)
 
     def system_random(self) -> Tuple[float, float, float, int]:
-        return choice(self.stars)
+        return self.star(randbelow(len(self.stars)))
+
+    def star(self, i: int) -> Tuple[float, float, float, int]:
+        """Return the Coordinates and Integer UUID of the Star at an Index."""
+        hi, lo = self.ids[i].tolist()
+        return (*self.stars[i].tolist(), hi << 64 | lo)
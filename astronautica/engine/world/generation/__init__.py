@@ -1,4 +1,4 @@
 """Generation: Package for creation of randomized structures."""
 
-from .galaxy import generate_galaxy
+from .galaxy import generate_galaxy, seed_galaxy
 from .system import generate_system
@@ -1,37 +1,66 @@
-from secrets import randbelow
-from typing import Sequence, Tuple
+from math import cos, radians, sin, sqrt
+from pathlib import Path
+from typing import Tuple
 
-from numba import jit
+from numba import jit, prange
 import numpy as np
-from numpy import random as npr
 
-from engine.space.geometry import from_spherical, to_spherical
 
+rng = np.random.default_rng()
 
+
+def seed_galaxy(seed: int = None) -> None:
+    """Reseed the Generator used for Galaxies, so that Generation can be
+        reproduced.
+    """
+    global rng
+    rng = np.random.default_rng(seed)
+
+
+@jit(nopython=True, parallel=True, fastmath=True, cache=True)
 def apply_swirl(stars: np.ndarray, deg: float, factor: float) -> None:
-    for star in stars:
-        rho, theta, phi = to_spherical(*star)
-        new = from_spherical(rho, theta, phi - deg - (deg * factor * rho))
-        star[:] = new
-
-
-@jit(forceobj=True)
-def offset(percent: float = 15) -> float:
-    return 1 + ((randbelow(percent * 2) - percent) / 100)
-
-
-@jit(forceobj=True)
-def generate_stars(count: int, sigma, center) -> np.ndarray:
-    return np.array(
-        [
-            (
-                npr.normal(center[0], sigma[0]),
-                npr.normal(center[1], sigma[1]),
-                npr.normal(center[2], sigma[2]),
-            )
-            for _ in range(count)
-        ]
-    )
+    """Turn an Array of Stars, shaped (N, 3), about the Z-Axis in place, each by
+        an Angle which grows with its Distance from the Origin.
+
+    Lowering the Azimuth turns a Star counterclockwise, seen from above. Z is
+        unchanged, so there is no need to go through Spherical Coordinates.
+    """
+    # Both Terms of the Angle are Loop-invariant, so convert them only once.
+    base = radians(deg)
+    scale = base * factor
+
+    for i in prange(stars.shape[0]):
+        x = stars[i, 0]
+        y = stars[i, 1]
+        z = stars[i, 2]
+        rho = sqrt(x * x + y * y + z * z)
+
+        angle = base + scale * rho
+        cos_ = cos(angle)
+        sin_ = sin(angle)
+
+        stars[i, 0] = x * cos_ - y * sin_
+        stars[i, 1] = x * sin_ + y * cos_
+
+
+def offset(percent: int = 15, size: int = None):
+    """Return a random Factor within a Percentage of One, or an Array of Size
+        such Factors.
+    """
+    return 1 + (rng.integers(-percent, percent, size) / 100)
+
+
+def center_xy(rho, phi) -> np.ndarray:
+    """Place Points in the Galactic Plane, at Distances Rho and Azimuths Phi,
+        in Degrees. Equivalent to Spherical Coordinates with no Elevation,
+        but with the Z Axis left at exactly Zero. Return an Array shaped
+        (..., 3).
+    """
+    rho, phi = np.broadcast_arrays(rho, np.radians(phi))
+    out = np.zeros((*rho.shape, 3))
+    out[..., 0] = rho * np.sin(phi)
+    out[..., 1] = rho * np.cos(phi)
+    return out
 
 
 def generate_galaxy(
@@ -45,51 +74,76 @@ def generate_galaxy(
     arm_curve: float = 1.75,
     clusters_per_arm: int = 8,
     stars_per_arm_cluster: int = 40,
-) -> Sequence[np.ndarray]:
-    o = (0, 0, 0)
+    dtype: np.dtype = np.float32,
+    filename: Path = None,
+) -> np.ndarray:
+    """Generate the Stars of a Galaxy. Return one Array, shaped (N, 3).
+
+    The Count, Spread and Center of every Group of Stars are decided first, as
+        Arrays, so that all of the Stars can be drawn in a single Call, into a
+        single Array, allocated once.
+
+    Star Positions are only ever plotted and searched, so Single Precision is
+        the default, halving the Memory of the Array.
+
+    If a Filename is given, the Stars are generated directly into a new NPY
+        File at that Path, through a Memory Map, rather than in Memory.
+    """
     radius = sum(sorted(size, reverse=True)[:2]) / 2
-    aradius = np.array((radius, radius, radius))
     size = np.array(size)
 
-    core = generate_stars(int(stars_in_core * offset()), aradius / 12, o)
-    apply_swirl(core, 20, 7.5)
-
-    cloud = generate_stars(int(stars_in_cloud * offset()), aradius, o)
+    # Position of each Cluster within an Arm, counting outward from One.
+    steps = np.arange(1, clusters_per_arm + 1)
+    arm_steps = np.tile(steps, arms)
+    arm_angles = np.repeat(
+        np.linspace(0, 360, arms, endpoint=False), clusters_per_arm
+    )
 
-    cluster_arrays = []
-    for _ in range(clusters):
-        cluster_arrays.extend(
-            generate_stars(
-                int(stars_per_cluster * offset()),
-                (h := size / 2),
-                from_spherical(npr.normal(0, h), 0, randbelow(360)),
-            )
+    # Base Number of Stars in every Group: Core, Cloud, Clusters, then Arms.
+    base = np.concatenate(
+        (
+            (stars_in_core, stars_in_cloud),
+            np.full(clusters, stars_per_cluster),
+            stars_per_arm_cluster * (1 - ((arm_steps - 1) / clusters_per_arm)),
         )
-    cluster_arrays = np.concatenate(cluster_arrays) if cluster_arrays else np.array([])
-
-    arm_arrays = []
-    for arm_num in range(arms):
-        arm = []
-        for cluster_num in range(1, clusters_per_arm + 1):
-            arm.append(
-                generate_stars(
-                    int(
-                        stars_per_arm_cluster * offset()
-                        * (1 - ((cluster_num - 1) / clusters_per_arm))
-                    ),
-                    (
-                        (sig := (radius / (2 + cluster_num))),
-                        sig,
-                        size[2] / 3,
-                    ),
-                    from_spherical(0.35 * cluster_num, 0, (360 / arms) * arm_num),
-                )
-            )
-
-        arm = np.concatenate(arm)
-        arm_arrays.append(arm)
-
-    arm_arrays = np.concatenate(arm_arrays) if arm_arrays else np.array([])
-    apply_swirl(arm_arrays, arm_turn, arm_curve)
-
-    return [x for x in (core, cloud, cluster_arrays, arm_arrays) if len(x) > 0]
+    )
+    counts = (base * offset(size=len(base))).astype(int)
+
+    sigmas = np.empty((len(base), 3))
+    sigmas[0] = radius / 12
+    sigmas[1] = radius
+    sigmas[2 : 2 + clusters] = size / 2
+    sigmas[2 + clusters :, 0] = sigmas[2 + clusters :, 1] = radius / (2 + arm_steps)
+    sigmas[2 + clusters :, 2] = size[2] / 3
+
+    centers = np.zeros((len(base), 3))
+    centers[2 : 2 + clusters] = center_xy(
+        rng.normal(0, radius / 2, clusters), rng.integers(360, size=clusters)
+    )
+    centers[2 + clusters :] = center_xy(0.35 * arm_steps, arm_angles)
+
+    # Draw every Star in one Call, then spread and shift each by its Group.
+    shape = (int(counts.sum()), 3)
+    if filename is None:
+        stars = np.empty(shape, dtype)
+    else:
+        stars = np.lib.format.open_memmap(filename, "w+", dtype, shape)
+    rng.standard_normal(out=stars, dtype=dtype)
+
+    # Work on each Group in place, so no Temporary the size of the whole Array
+    #   is ever made, which matters when the Array is only mapped from a File.
+    bounds = np.cumsum(counts).tolist()
+    for start, end, sigma, center in zip(
+        [0, *bounds], bounds, sigmas.tolist(), centers.tolist()
+    ):
+        group = stars[start:end]
+        group *= sigma
+        group += center
+
+    apply_swirl(stars[: bounds[0]], 20, 7.5)  # Core.
+    apply_swirl(stars[bounds[1 + clusters] :], arm_turn, arm_curve)  # Arms.
+
+    if filename is not None:
+        stars.flush()
+
+    return stars
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Iterator, Tuple
 
 from astropy import units as u
 
@@ -13,25 +13,42 @@ class Orbit(object):
         self.satellite: Node = satellite
 
 
-class MultiSystem(List[Node], Node):
+class MultiSystem(Node):
     """Representation of a Gravitational System without any clear Primary.
         Typically the case for Stars near each other.
     """
 
+    __slots__ = ("_mass", "bodies")
+
     def __init__(self, *bodies: Node):
         if len(bodies) < 2:
             raise ValueError("A Multi System must have at least two Objects.")
 
-        super().__init__(self, bodies)
+        self.bodies: Tuple[Node, ...] = bodies
+        self._mass = None
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self.bodies)
+
+    def __len__(self) -> int:
+        return len(self.bodies)
+
+    def invalidate(self):
+        """Forget the cached Mass of this System. Must be called if the Mass of
+            any Body in it changes.
+        """
+        self._mass = None
 
     @property
     def mass(self):
-        return sum((o.mass for o in self), u.kg * 0)
+        if self._mass is None:
+            self._mass = sum((o.mass for o in self.bodies), u.kg * 0)
+        return self._mass
 
     def serialize(self):
         return dict(
             type=type(self).__name__,
-            subs=dict(bodies=[s for o in self if (s := o.serialize())]),
+            subs=dict(bodies=[s for o in self.bodies if (s := o.serialize())]),
         )
 
     @classmethod
@@ -39,28 +56,42 @@ class MultiSystem(List[Node], Node):
         return cls(*subs["bodies"])
 
 
-class System(List[Node], Node):
+class System(Node):
     """Representation of a Gravitational System with a clear Primary. Typically
         the case for Planetary Systems orbiting a single Star.
     """
 
-    __slots__ = ("primary",)
+    __slots__ = ("_mass", "primary", "satellites")
 
     def __init__(self, primary: Node, *satellites: Node):
         self.primary: Node = primary
+        self.satellites: Tuple[Node, ...] = satellites
+        self._mass = None
+
+    def __iter__(self) -> Iterator[Node]:
+        return iter(self.satellites)
+
+    def __len__(self) -> int:
+        return len(self.satellites)
 
-        super().__init__(self, satellites)
+    def invalidate(self):
+        """Forget the cached Mass of this System. Must be called if the Mass of
+            the Primary or of any Satellite changes.
+        """
+        self._mass = None
 
     @property
     def mass(self):
-        return sum((o.mass for o in self), self.primary.mass)
+        if self._mass is None:
+            self._mass = sum((o.mass for o in self.satellites), self.primary.mass)
+        return self._mass
 
     def serialize(self):
         return dict(
             type=type(self).__name__,
             subs=dict(
                 primary=self.primary.serialize(),
-                slaves=[s for o in self if (s := o.serialize())]
+                satellites=[s for o in self.satellites if (s := o.serialize())],
             ),
         )
 
@@ -1,8 +1,15 @@
 """Interface Package: Command line Client and all integrations with Engine."""
 
-from asyncio import AbstractEventLoop  # , sleep
+import asyncio
+from asyncio import AbstractEventLoop, set_event_loop  # , sleep
 from typing import List, Tuple
 
+try:
+    # The libuv Loop has much cheaper Callbacks, but is not on every Platform.
+    from uvloop import new_event_loop
+except ImportError:
+    from asyncio import new_event_loop
+
 from ezipc.util import P
 
 from .client import setup_client
@@ -12,8 +19,22 @@ from .server import setup_host
 from .tui import Interface
 
 
+def make_loop() -> AbstractEventLoop:
+    """Create the Event Loop for the Interface, and set it as Current. This is
+        a uvloop Loop if that Package is installed.
+    """
+    loop = new_event_loop()
+    set_event_loop(loop)
+    return loop
+
+
 def get_client(loop: AbstractEventLoop) -> Tuple[Interface, CommandRoot]:
     cmd = CommandRoot()
+    if hasattr(asyncio, "eager_task_factory"):
+        # Most Hooks and Commands finish without ever suspending. Run them
+        #   inline, rather than through a Trip around the Ready Queue.
+        loop.set_task_factory(asyncio.eager_task_factory)
+
     cli = Interface(loop, command_handler=cmd)
     P.output_line = cli.print
 
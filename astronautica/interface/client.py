@@ -1,8 +1,8 @@
 from asyncio import AbstractEventLoop, CancelledError
-from functools import wraps
+from functools import lru_cache, wraps
+from ipaddress import IPv4Address
 from pathlib import Path
-from re import compile
-from typing import Optional
+from typing import Optional, Tuple
 
 from ezipc.remote import RemoteError
 from ezipc.util import echo
@@ -12,13 +12,37 @@ from .tui import Interface
 from config import cfg
 
 
-pattern_address = compile(r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}(:\d{1,5})?")
+@lru_cache(maxsize=32)
+def _parse_addr(addr_port: str, default_port: int) -> Tuple[str, int]:
+    """Split a String of an IPv4 Address, with an optional Port, into the
+        Address and the Port. Raise ValueError if either is not valid.
+    """
+    addr, sep, port = addr_port.rpartition(":")
+    if not sep:
+        addr, port = port, str(default_port)
+
+    try:
+        IPv4Address(addr)
+    except ValueError:
+        raise ValueError(f"Invalid IPv4 Address: {addr_port}") from None
+
+    # Only plain Digits; int() alone would also take Signs and Whitespace.
+    if not (port.isascii() and port.isdigit() and 0 < int(port) <= 65535):
+        raise ValueError(f"Invalid IPv4 Address: {addr_port}")
+
+    return addr, int(port)
 
 
 def setup_client(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
     from ezipc.client import Client
 
+    # Connection Settings do not change after Setup. Look them up only once.
+    default_addr: str = cfg.get("connection/address", "127.0.0.1")
+    default_port: int = cfg.get("connection/port", required=True)
+    deny_custom: bool = cfg.get("connection/deny_custom_server", False)
+
     client: Optional[Client] = None
+    output = cli.print
     cli.console_header = (
         lambda: " :: ".join(
             (
@@ -99,24 +123,13 @@ def setup_client(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
 
     @cmd(task=True)
     @needs_no_remote
-    async def connect(addr_port: str = cfg.get("connection/address", "127.0.0.1")):
+    async def connect(addr_port: str = default_addr):
         nonlocal client
 
-        if cfg.get("connection/deny_custom_server", False):
-            addr_port = (
-                f'{cfg.get("connection/address", "127.0.0.1")}'
-                f':{cfg.get("connection/port", required=True)}'
-            )
-
-        if not pattern_address.fullmatch(addr_port):
-            raise ValueError(f"Invalid IPv4 Address: {addr_port}")
-        elif ":" in addr_port:
-            addr, port = addr_port.split(":")
-        else:
-            addr = addr_port
-            port = cfg.get("connection/port", required=True)
+        if deny_custom:
+            addr_port = f"{default_addr}:{default_port}"
 
-        client = Client(addr, int(port))
+        client = Client(*_parse_addr(addr_port, default_port))
 
         @client.hook_notif("TLM.UPDATE")
         async def update(data: list):
@@ -125,7 +138,8 @@ def setup_client(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
 
         @client.hook_notif("ETC.PRINT")
         async def _print(data: list):
-            cli.print(*(f"{client.remote}: {line}" for line in data))
+            remote = client.remote
+            output(*(f"{remote}: {line}" for line in data))
 
         @client.hook_notif("USR.SYNC")
         async def set_id(data: dict):
@@ -136,6 +150,8 @@ def setup_client(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
 
         try:
             await client.connect(loop)
+            # The Listener is already running as its own Task by now, so it is
+            #   not held back while the first Fetch is awaited.
             try:
                 await fetch()
             except RemoteError:
@@ -148,10 +164,10 @@ def setup_client(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
                 await client.listening
 
         except CancelledError:
-            cli.print("Connection closed.")
+            output("Connection closed.")
 
         except Exception as e:
-            cli.print(f"Connection failed: {type(e).__name__}: {e}")
+            output(f"Connection failed: {type(e).__name__}: {e}")
 
         finally:
             # CLEANUP
@@ -21,6 +21,10 @@ DATA_DIR = Path(cfg["data/directory"])
 def setup_host(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
     from ezipc.server import Server
 
+    # Connection Settings do not change after Setup. Look them up only once.
+    default_addr: str = cfg.get("connection/address", "127.0.0.1")
+    default_port: int = cfg.get("connection/port", required=True)
+
     P.verbosity = 3
     server: Optional[Server] = None
     sessions: Dict[Remote, Session] = {}
@@ -135,9 +139,10 @@ def setup_host(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
     @galaxy.sub
     async def rename(path: str = None):
         """Change the storage location of the current Galaxy."""
-        path = DATA_DIR / path
-        if path.parent != DATA_DIR:
+        # Reject anything but a plain Name before building any Path Objects.
+        if not path or path in (".", "..") or "/" in path or "\\" in path:
             return "Galaxy Directory must be a simple name."
+        path = DATA_DIR / path
         st.world.rename(path)
         hostup()
         return f"Galaxy Renamed. New location: {path}"
@@ -204,8 +209,8 @@ def setup_host(cli: Interface, cmd: CommandRoot, loop: AbstractEventLoop):
         """Open the Server and begin simulating the passage of Time."""
         nonlocal server
         server = Server(
-            ip4 or cfg.get("connection/address", "127.0.0.1"),
-            port or cfg.get("connection/port", required=True),
+            ip4 or default_addr,
+            port or default_port,
         )
         server.setup()
 
@@ -0,0 +1,12 @@
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).parent.parent / "astronautica"
+
+# The Game is run from within its own Directory, and imports its Packages at
+#   the top Level, such as `engine` and `config`. Tests do the same.
+sys.path.insert(0, str(ROOT))
+
+# The Config File is found relative to the Script being run. Point that at the
+#   Game Directory before anything imports the Config.
+sys.argv[0] = str(ROOT)
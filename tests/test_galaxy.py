@@ -0,0 +1,33 @@
+from pathlib import Path
+
+import numpy as np
+
+from engine.world.generation import generate_galaxy, seed_galaxy
+
+
+def test_generate_galaxy_shape():
+    seed_galaxy(0)
+    stars = generate_galaxy((1.4, 1, 0.2), arms=3)
+
+    assert stars.ndim == 2 and stars.shape[1] == 3
+    assert stars.dtype == np.float32
+    assert np.isfinite(stars).all()
+
+
+def test_generate_galaxy_without_arms():
+    seed_galaxy(0)
+    stars = generate_galaxy((1.4, 1, 0.2), arms=0)
+
+    assert stars.shape[0] > 0 and stars.shape[1] == 3
+    assert np.isfinite(stars).all()
+
+
+def test_generate_galaxy_into_file(tmp_path):
+    filename = tmp_path / "STARS.npy"
+    seed_galaxy(0)
+    stars = generate_galaxy((1.4, 1, 0.2), arms=3, filename=filename)
+
+    assert isinstance(stars, np.memmap)
+    assert Path(stars.filename).resolve() == filename.resolve()
+    assert stars.dtype == np.float32
+    assert np.array_equal(np.load(filename), stars)
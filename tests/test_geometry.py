@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+from engine.space.geometry import (
+    to_cylindrical,
+    to_cylindrical_batch,
+    to_spherical,
+    to_spherical_batch,
+)
+
+
+def test_batch_matches_scalar():
+    points = np.random.default_rng(0).standard_normal((5, 3))
+
+    assert np.allclose(
+        to_spherical_batch(points), [to_spherical(*p) for p in points.tolist()]
+    )
+    assert np.allclose(
+        to_cylindrical_batch(points), [to_cylindrical(*p) for p in points.tolist()]
+    )
+
+
+@pytest.mark.parametrize("shape", [(4, 2), (4, 4)])
+def test_batch_rejects_wrong_shape(shape):
+    with pytest.raises(ValueError):
+        to_spherical_batch(np.zeros(shape))
+    with pytest.raises(ValueError):
+        to_cylindrical_batch(np.zeros(shape))
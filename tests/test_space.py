@@ -0,0 +1,21 @@
+import numpy as np
+
+from engine.space import Coordinates, LocalSpace, Space
+
+
+def test_released_domain_is_zeroed_and_reused():
+    space = Space()
+    first = LocalSpace(None, space)
+    co = Coordinates(first)
+    co.position = (1, 2, 3)
+    co.velocity = (4, 5, 6)
+    index = first.index
+
+    first.free()
+    assert index not in space.domains
+    assert not space.array_position[index].any()
+    assert not space.array_velocity[index].any()
+
+    second = LocalSpace(None, space)
+    assert second.index == index
+    assert not second.array_position.any()
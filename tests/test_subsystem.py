@@ -0,0 +1,55 @@
+from random import Random
+
+import numpy as np
+import pytest
+
+from engine.vessel.subsystem import Staff, wound
+
+
+def wound_sequential(intact: int, worn: int, number: int, rand: Random):
+    """The original Loop, one Hit at a time, kept here as the Reference."""
+    lost = 0
+    for _ in range(number):
+        if intact > 0:
+            if rand.randrange(intact) < worn:
+                worn -= 1
+                intact -= 1
+                lost += 1
+            else:
+                worn += 1
+
+    return worn, lost
+
+
+@pytest.mark.parametrize("intact,worn,number", [(100, 0, 100), (10, 5, 10)])
+def test_wound_matches_sequential(intact, worn, number):
+    trials = 5000
+    rng = np.random.default_rng(1)
+    rand = Random(1)
+
+    batched = np.array([wound(intact, worn, number, rng) for _ in range(trials)])
+    reference = np.array(
+        [wound_sequential(intact, worn, number, rand) for _ in range(trials)]
+    )
+
+    # Compare the Means of worn and destroyed Members, within a Margin of
+    #   several Standard Errors.
+    stderr = np.sqrt((batched.var(axis=0) + reference.var(axis=0)) / trials)
+    margin = 5 * stderr + 0.01
+    assert np.all(np.abs(batched.mean(axis=0) - reference.mean(axis=0)) < margin)
+
+
+def test_wound_empty_population():
+    assert wound(0, 0, 5, np.random.default_rng()) == (0, 0)
+
+
+def test_staff_assignment_bumps_gen():
+    staff = Staff()
+    gen = staff.gen
+
+    staff.crew = 10
+    assert staff.gen > gen
+
+    gen = staff.gen
+    staff.work = 1
+    assert staff.gen == gen
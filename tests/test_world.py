@@ -0,0 +1,28 @@
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from engine.world import Galaxy, random_ids
+
+
+def make_galaxy(gdir) -> Galaxy:
+    stars = np.random.default_rng(0).standard_normal((20, 3))
+    return Galaxy(stars, random_ids(len(stars)), gdir, uuid4())
+
+
+def test_galaxy_save_and_load(tmp_path):
+    galaxy = make_galaxy(tmp_path / "galaxy")
+    loaded = Galaxy.from_file(galaxy.save())
+
+    assert np.array_equal(loaded.stars, galaxy.stars)
+    assert np.array_equal(loaded.ids, galaxy.ids)
+    assert loaded.gid == galaxy.gid
+
+
+def test_galaxy_load_without_ids(tmp_path):
+    gdir = make_galaxy(tmp_path / "galaxy").save()
+    (gdir / "IDS.npy").unlink()
+
+    with pytest.raises(FileNotFoundError):
+        Galaxy.from_file(gdir)